@@ -3,16 +3,28 @@ Flask backend for CSV Chatbot with Gemini AI integration.
 Provides API endpoints for file upload, chat, and visualizations.
 """
 
-from flask import Flask, request, jsonify, send_file, session
+from flask import Flask, Response, request, jsonify, send_file, session, stream_with_context
 from flask_cors import CORS
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import google.generativeai as genai
+from google.generativeai import protos
+import google.ai.generativelanguage as glm
 from dotenv import load_dotenv
 import os
 import json
+import orjson
+import traceback
 from werkzeug.utils import secure_filename
-from tools import DataFrameAnalyzer, TOOLS
+from werkzeug.exceptions import RequestEntityTooLarge
+from tools import DataFrameAnalyzer, TOOLS, VIZ_FOLDER
 import uuid
+import time
+from types import MappingProxyType
+import hashlib
+import threading
+from cachetools import TTLCache
 
 # Load environment variables
 load_dotenv()
@@ -32,16 +44,169 @@ app.secret_key = os.urandom(24)  # For session management
 CORS(app)
 
 # Configuration
-UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'csv'}
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
+HASH_CHUNK_SIZE = 1024 * 1024  # 1MB
+MAX_SESSIONS = int(os.getenv('MAX_SESSIONS', '50'))
+SESSION_TTL = int(os.getenv('SESSION_TTL', str(2 * 60 * 60)))  # 2 hours
 
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-os.makedirs('visualizations', exist_ok=True)
+# Reject oversize request bodies before anything is copied
+app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
+
+os.makedirs(VIZ_FOLDER, exist_ok=True)
 
 # Store DataFrames and chat history per session
-# In production, use Redis or database
-sessions_data = {}
+# Bounded so abandoned sessions are evicted (least recently used or idle too long)
+# TTLCache is not thread-safe, so every access goes through sessions_lock
+sessions_data = TTLCache(maxsize=MAX_SESSIONS, ttl=SESSION_TTL)
+sessions_lock = threading.Lock()
+
+
+# JSON schema type names to Gemini schema types
+SCHEMA_TYPES = MappingProxyType({
+    'string': protos.Type.STRING,
+    'array': protos.Type.ARRAY,
+    'object': protos.Type.OBJECT,
+    'number': protos.Type.NUMBER,
+    'integer': protos.Type.INTEGER,
+    'boolean': protos.Type.BOOLEAN
+})
+
+
+def _build_tool_declarations(tools):
+    """Convert tool definitions to Gemini FunctionDeclaration format."""
+    # Array item schemas only carry a type, so build one per type and share it
+    item_schemas = {}
+    
+    function_declarations = []
+    for tool in tools:
+        # Convert parameters dict to Schema
+        params_dict = tool['parameters']
+        properties = {}
+        
+        for prop_name, prop_def in params_dict.get('properties', {}).items():
+            # Build Schema kwargs dynamically (only add non-None values)
+            prop_type = prop_def.get('type', 'string')
+            prop_schema_kwargs = {
+                'type': SCHEMA_TYPES.get(prop_type, protos.Type.STRING)
+            }
+            if 'description' in prop_def:
+                prop_schema_kwargs['description'] = prop_def['description']
+            if 'enum' in prop_def:
+                prop_schema_kwargs['enum'] = prop_def['enum']
+            if 'items' in prop_def:
+                items_type = prop_def['items'].get('type', 'string')
+                if items_type not in item_schemas:
+                    item_schemas[items_type] = protos.Schema(
+                        type=SCHEMA_TYPES.get(items_type, protos.Type.STRING)
+                    )
+                prop_schema_kwargs['items'] = item_schemas[items_type]
+            
+            properties[prop_name] = protos.Schema(**prop_schema_kwargs)
+        
+        parameters_schema = protos.Schema(
+            type=protos.Type.OBJECT,
+            properties=properties,
+            required=params_dict.get('required', [])
+        )
+        
+        func_dec = protos.FunctionDeclaration(
+            name=tool['name'],
+            description=tool['description'],
+            parameters=parameters_schema
+        )
+        function_declarations.append(func_dec)
+    
+    return [protos.Tool(function_declarations=function_declarations)]
+
+
+# Tool schemas and the model are the same for every request, so build them once
+_TOOL_DECLARATIONS = _build_tool_declarations(TOOLS)
+_MODEL = genai.GenerativeModel(
+    model_name=GEMINI_MODEL,
+    tools=_TOOL_DECLARATIONS
+)
+
+
+def file_fingerprint(stream):
+    """Hash an uploaded file's bytes so identical CSVs share cached tool results."""
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: stream.read(HASH_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def _rewind(source):
+    """Move a file-like source back to its start (paths need nothing)."""
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+
+def _has_temporal_columns(source):
+    """Check whether pyarrow would infer any date, time or timestamp columns."""
+    # Types are inferred from the first block, so reading just that block is enough
+    reader = pacsv.open_csv(source)
+    try:
+        schema = reader.schema
+    finally:
+        reader.close()
+        _rewind(source)
+    return any(
+        pa.types.is_date(field.type) or pa.types.is_time(field.type) or pa.types.is_timestamp(field.type)
+        for field in schema
+    )
+
+
+def _differs_from_c_parser(df):
+    """Check whether a pyarrow-parsed frame holds anything the C parser reads differently."""
+    # The C parser renames duplicate and blank headers (a.1, Unnamed: 0)
+    if df.columns.has_duplicates or (df.columns == '').any():
+        return True
+    for name, dtype in df.dtypes.items():
+        # Non-UTF-8 text comes back as bytes, where the C parser raises a decode error
+        if dtype == object and pd.api.types.infer_dtype(df[name], skipna=True) != 'string':
+            return True
+        # Integers outside int64 become floats, where the C parser keeps them exact
+        if dtype.kind == 'f' and df[name].abs().max() >= 2 ** 63:
+            return True
+    return False
+
+
+def read_csv(source):
+    """
+    Read a CSV into a DataFrame using the multithreaded pyarrow parser.
+    
+    pyarrow types ISO dates and times itself, where the C parser keeps them as
+    strings. It also keeps duplicate headers, reads integers beyond int64 as
+    floats and accepts non-UTF-8 text as bytes. Files hitting any of these go
+    through the C parser so tools and user code see the same result either way.
+    """
+    try:
+        if not _has_temporal_columns(source):
+            df = pd.read_csv(source, engine='pyarrow')
+            if not _differs_from_c_parser(df):
+                return df
+    except Exception:
+        # pyarrow is stricter about malformed rows; retry with the default C parser
+        pass
+    _rewind(source)
+    return pd.read_csv(source)
+
+
+def sweep_stale_files(folder, max_age, keep=frozenset()):
+    """Delete files in folder older than max_age seconds, except those named in keep."""
+    cutoff = time.time() - max_age
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.name in keep:
+                continue
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                # Another worker may have removed it already
+                pass
 
 
 def allowed_file(filename):
@@ -56,6 +221,84 @@ def get_session_id():
     return session['session_id']
 
 
+def json_default(value):
+    """Encode values orjson doesn't handle natively (pandas timestamps, NaT/NA, etc.)."""
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, (pd.Timestamp, pd.Timedelta)):
+        return value.isoformat()
+    return str(value)
+
+
+def _stringify_big_ints(value):
+    """Replace integers beyond 64 bits, which orjson refuses, with their decimal text."""
+    if isinstance(value, dict):
+        return {_stringify_big_ints(k) if isinstance(k, int) else k: _stringify_big_ints(v)
+                for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_stringify_big_ints(v) for v in value]
+    if isinstance(value, int) and not -2 ** 63 <= value < 2 ** 64:
+        return str(value)
+    return value
+
+
+def to_json(data):
+    """Encode data as JSON bytes; orjson writes NaN as null, where json.dumps emits bare NaN."""
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    try:
+        return orjson.dumps(data, default=json_default, option=option)
+    except orjson.JSONEncodeError:
+        # Object columns can hold integers past int64; retry with those as strings
+        return orjson.dumps(_stringify_big_ints(data), default=json_default, option=option)
+
+
+def sse_event(event, data):
+    """Format one server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {to_json(data).decode()}\n\n"
+
+
+def run_tool(analyzer, function_name, function_args):
+    """Execute a Gemini function call against the session's analyzer."""
+    print(f"DEBUG: Calling function: {function_name} with args: {function_args}")
+    
+    try:
+        tool_function = analyzer.tool_functions.get(function_name)
+        if tool_function:
+            result = tool_function(**function_args)
+        else:
+            result = {"error": f"Unknown function: {function_name}"}
+        
+        print(f"DEBUG: Function {function_name} returned: {str(result)[:200]}...")
+    except Exception as func_error:
+        print(f"DEBUG: Function {function_name} failed: {func_error}")
+        traceback.print_exc()
+        result = {"error": f"Function execution failed: {str(func_error)}"}
+    
+    return result
+
+
+def build_function_response(function_name, result):
+    """Wrap a tool result in a FunctionResponse to send back to Gemini."""
+    # Analyzer results are already JSON-safe, so try them as-is first
+    try:
+        return glm.FunctionResponse(
+            name=function_name,
+            response={"result": result}
+        )
+    except Exception as convert_error:
+        # Fall back to a JSON round trip for anything unexpected (numpy types, integer keys, etc.)
+        print(f"DEBUG: Direct conversion failed: {convert_error}, using JSON round trip")
+        try:
+            serializable_result = json.loads(json.dumps(result, default=str))
+        except Exception as json_error:
+            print(f"DEBUG: JSON conversion failed: {json_error}, using string conversion")
+            serializable_result = {"data": str(result)}
+        return glm.FunctionResponse(
+            name=function_name,
+            response={"result": serializable_result}
+        )
+
+
 @app.route('/api/upload', methods=['POST'])
 def upload_file():
     """Handle CSV file upload."""
@@ -71,48 +314,42 @@ def upload_file():
         if not allowed_file(file.filename):
             return jsonify({'error': 'Invalid file type. Please upload a CSV file'}), 400
         
-        # Save file
         filename = secure_filename(file.filename)
-        filepath = os.path.join(UPLOAD_FOLDER, filename)
-        file.save(filepath)
         
-        # Read CSV into DataFrame
+        fingerprint = file_fingerprint(file.stream)
+        
+        # Read CSV straight from the upload stream; nothing else needs a copy on disk
         try:
-            df = pd.read_csv(filepath)
+            df = read_csv(file.stream)
         except Exception as e:
             return jsonify({'error': f'Error reading CSV: {str(e)}'}), 400
+        finally:
+            # Large uploads are spooled to a temp file; release it as soon as it is parsed
+            file.close()
+        
+        # Old charts no live session drew belong to expired sessions. Chatting
+        # resets a session's TTL, so its charts can be older than SESSION_TTL.
+        # Freezing the timer keeps entries from expiring mid-iteration
+        with sessions_lock, sessions_data.timer:
+            live_charts = {name for state in sessions_data.values()
+                           for name in state['analyzer'].viz_files}
+        sweep_stale_files(VIZ_FOLDER, SESSION_TTL, keep=live_charts)
         
         # Initialize session data
         session_id = get_session_id()
-        analyzer = DataFrameAnalyzer(df)
-        
-        sessions_data[session_id] = {
-            'df': df,
-            'analyzer': analyzer,
-            'filename': filename,
-            'filepath': filepath,
-            'chat_history': []
-        }
+        analyzer = DataFrameAnalyzer(df, fingerprint=fingerprint)
         
         # Get basic info
         info = analyzer.dataframe_info()
         
-        
         # Get preview data (first 100 rows for pagination)
         preview_data = df.head(100).to_dict('records')
         
-        # Clean NaN values from dict (to_dict converts None back to nan)
-        import math
-        for row in preview_data:
-            for key in list(row.keys()):
-                value = row[key]
-                # Check if value is float NaN
-                if isinstance(value, float) and math.isnan(value):
-                    row[key] = None
-        
         columns = list(df.columns)
         
-        return jsonify({
+        # orjson writes NaN as null, so the preview needs no separate cleanup pass.
+        # Encode before storing the session so a failure doesn't leave it half set up.
+        payload = to_json({
             'success': True,
             'filename': filename,
             'info': info,
@@ -123,17 +360,25 @@ def upload_file():
             'message': f'Successfully uploaded {filename} with {info["shape"]["rows"]} rows and {info["shape"]["columns"]} columns'
         })
         
+        with sessions_lock:
+            sessions_data[session_id] = {
+                'df': df,
+                'analyzer': analyzer,
+                'filename': filename,
+                'chat_history': []
+            }
+        
+        return Response(payload, mimetype='application/json')
+        
+    except RequestEntityTooLarge:
+        return jsonify({'error': f'File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB'}), 413
     except Exception as e:
         return jsonify({'error': f'Upload error: {str(e)}'}), 500
 
 
 @app.route('/api/chat', methods=['POST'])
 def chat():
-    """Handle chat requests with Gemini AI."""
-    import json
-    from google.generativeai import protos
-    import google.ai.generativelanguage as glm
-    
+    """Handle chat requests with Gemini AI, streaming the reply as server-sent events."""
     try:
         data = request.json
         user_message = data.get('message', '').strip()
@@ -144,10 +389,15 @@ def chat():
         session_id = get_session_id()
         
         # Check if session has data
-        if session_id not in sessions_data:
+        with sessions_lock:
+            session_state = sessions_data.get(session_id)
+            if session_state is not None:
+                # Re-insert to restart the idle timer
+                sessions_data[session_id] = session_state
+        
+        if session_state is None:
             return jsonify({'error': 'No CSV file uploaded. Please upload a file first.'}), 400
         
-        session_state = sessions_data[session_id]
         analyzer = session_state['analyzer']
         chat_history = session_state['chat_history']
         
@@ -157,63 +407,6 @@ def chat():
             'content': user_message
         })
         
-        # Create Gemini model with tools  
-        # Convert tool definitions to proper FunctionDeclaration format
-        
-        function_declarations = []
-        for tool in TOOLS:
-            # Convert parameters dict to Schema
-            params_dict = tool['parameters']
-            properties = {}
-            
-            for prop_name, prop_def in params_dict.get('properties', {}).items():
-                # Convert property definition to Schema
-                prop_type = prop_def.get('type', 'string')
-                type_mapping = {
-                    'string': protos.Type.STRING,
-                    'array': protos.Type.ARRAY,
-                    'object': protos.Type.OBJECT,
-                    'number': protos.Type.NUMBER,
-                    'integer': protos.Type.INTEGER,
-                    'boolean': protos.Type.BOOLEAN
-                }
-                
-                # Build Schema kwargs dynamically (only add non-None values)
-                prop_schema_kwargs = {
-                    'type': type_mapping.get(prop_type, protos.Type.STRING)
-                }
-                if 'description' in prop_def:
-                    prop_schema_kwargs['description'] = prop_def['description']
-                if 'enum' in prop_def:
-                    prop_schema_kwargs['enum'] = prop_def['enum']
-                if 'items' in prop_def:
-                    items_type = prop_def['items'].get('type', 'string')
-                    prop_schema_kwargs['items'] = protos.Schema(
-                        type=type_mapping.get(items_type, protos.Type.STRING)
-                    )
-                
-                properties[prop_name] = protos.Schema(**prop_schema_kwargs)
-            
-            parameters_schema = protos.Schema(
-                type=protos.Type.OBJECT,
-                properties=properties,
-                required=params_dict.get('required', [])
-            )
-            
-            func_dec = protos.FunctionDeclaration(
-                name=tool['name'],
-                description=tool['description'],
-                parameters=parameters_schema
-            )
-            function_declarations.append(func_dec)
-        
-        tool_declarations = [protos.Tool(function_declarations=function_declarations)]
-        
-        model = genai.GenerativeModel(
-            model_name=GEMINI_MODEL,
-            tools=tool_declarations
-        )
-        
         # Build conversation history for Gemini in the correct format
         history_for_gemini = []
         
@@ -250,107 +443,94 @@ You have access to analysis tools to help answer questions about this data. Use
                     'parts': [msg['content']]
                 })
         # Send to Gemini with full conversation history
-        chat = model.start_chat(history=history_for_gemini)
-        response = chat.send_message(user_message)
-        
-        # Check if Gemini wants to call functions
-        function_responses = []
-        
-        while response.candidates[0].content.parts:
-            part = response.candidates[0].content.parts[0]
-            
-            # Check for function call
-            if hasattr(part, 'function_call') and part.function_call:
-                function_call = part.function_call
-                function_name = function_call.name
-                function_args = dict(function_call.args)
-                
-                print(f"DEBUG: Calling function: {function_name} with args: {function_args}")
+        chat = _MODEL.start_chat(history=history_for_gemini)
+        
+        def generate():
+            """Stream the reply as server-sent events, running tool calls between turns."""
+            try:
+                response = chat.send_message(user_message, stream=True)
+                function_responses = []
+                text_parts = []
                 
-                # Execute the function
-                try:
-                    if function_name == 'dataframe_info':
-                        result = analyzer.dataframe_info()
-                    elif function_name == 'statistical_summary':
-                        result = analyzer.statistical_summary(**function_args)
-                    elif function_name == 'python_analysis':
-                        result = analyzer.python_analysis(**function_args)
-                    elif function_name == 'create_visualization':
-                        result = analyzer.create_visualization(**function_args)
-                    else:
-                        result = {"error": f"Unknown function: {function_name}"}
+                while True:
+                    # Forward text as it arrives and note any function call in this turn
+                    function_call = None
+                    turn_has_text = False
+                    for chunk in response:
+                        if not chunk.candidates:
+                            continue
+                        for part in chunk.candidates[0].content.parts:
+                            if hasattr(part, 'function_call') and part.function_call:
+                                function_call = function_call or part.function_call
+                            elif part.text:
+                                text = part.text
+                                # Keep each turn's text (e.g. before and after a tool call) a separate paragraph
+                                if text_parts and not turn_has_text:
+                                    text = '\n\n' + text
+                                turn_has_text = True
+                                text_parts.append(text)
+                                yield sse_event('text', {'text': text})
                     
-                    print(f"DEBUG: Function {function_name} returned: {str(result)[:200]}...")
-                except Exception as func_error:
-                    print(f"DEBUG: Function {function_name} failed: {func_error}")
-                    import traceback
-                    traceback.print_exc()
-                    result = {"error": f"Function execution failed: {str(func_error)}"}
+                    if function_call is None:
+                        # No more function calls, this was the final response
+                        break
+                    
+                    function_name = function_call.name
+                    # to_dict converts the proto Struct, list values included, into plain Python
+                    function_args = type(function_call).to_dict(function_call).get('args', {})
+                    result = run_tool(analyzer, function_name, function_args)
+                    
+                    function_responses.append({
+                        'function': function_name,
+                        'arguments': function_args,
+                        'result': result
+                    })
+                    yield sse_event('function_call', function_responses[-1])
+                    
+                    # Send function result back to Gemini and stream its next turn
+                    response = chat.send_message(
+                        glm.Content(
+                            parts=[
+                                glm.Part(function_response=build_function_response(function_name, result))
+                            ]
+                        ),
+                        stream=True
+                    )
+                
+                assistant_message = ''.join(text_parts) or "I've processed the data."
                 
-                function_responses.append({
-                    'function': function_name,
-                    'arguments': function_args,
-                    'result': result
+                # Add assistant response to history
+                chat_history.append({
+                    'role': 'assistant',
+                    'content': assistant_message,
+                    'function_calls': function_responses if function_responses else None
                 })
                 
-                # Send function result back to Gemini
-                # Convert result to JSON and back to ensure all types are serializable
-                # This handles numpy types, integer keys, etc.
-                try:
-                    json_str = json.dumps(result, default=str)
-                    serializable_result = json.loads(json_str)
-                except Exception as json_error:
-                    print(f"DEBUG: JSON conversion failed: {json_error}, using string conversion")
-                    serializable_result = {"data": str(result)}
+                # Check if any visualizations were created
+                visualizations = []
+                for func_resp in function_responses:
+                    if func_resp['function'] == 'create_visualization' and 'url' in func_resp['result']:
+                        visualizations.append(func_resp['result']['url'])
                 
-                print(f"DEBUG: Sending serializable result: {str(serializable_result)[:200]}...")
+                yield sse_event('done', {
+                    'success': True,
+                    'message': assistant_message,
+                    'function_calls': function_responses,
+                    'visualizations': visualizations
+                })
                 
-                response = chat.send_message(
-                    glm.Content(
-                        parts=[
-                            glm.Part(
-                                function_response=glm.FunctionResponse(
-                                    name=function_name,
-                                    response={"result": serializable_result}
-                                )
-                            )
-                        ]
-                    )
-                )
-            else:
-                # No more function calls, get final response
-                break
-        
-        # Extract final text response safely
-        try:
-            assistant_message = response.text
-        except ValueError:
-            # If response has no text (e.g., only function calls), get text from parts
-            text_parts = [part.text for part in response.candidates[0].content.parts if hasattr(part, 'text') and part.text]
-            assistant_message = ' '.join(text_parts) if text_parts else "I've processed the data."
-        
-        # Add assistant response to history
-        chat_history.append({
-            'role': 'assistant',
-            'content': assistant_message,
-            'function_calls': function_responses if function_responses else None
-        })
-        
-        # Check if any visualizations were created
-        visualizations = []
-        for func_resp in function_responses:
-            if func_resp['function'] == 'create_visualization' and 'url' in func_resp['result']:
-                visualizations.append(func_resp['result']['url'])
-        
-        return jsonify({
-            'success': True,
-            'message': assistant_message,
-            'function_calls': function_responses,
-            'visualizations': visualizations
-        })
+            except Exception as e:
+                error_trace = traceback.format_exc()
+                print(f"CHAT ERROR TRACEBACK:\n{error_trace}")
+                yield sse_event('error', {'error': f'Chat error: {str(e)}'})
+        
+        return Response(
+            stream_with_context(generate()),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
         
     except Exception as e:
-        import traceback
         error_trace = traceback.format_exc()
         print(f"CHAT ERROR TRACEBACK:\n{error_trace}")
         return jsonify({'error': f'Chat error: {str(e)}'}), 500
@@ -360,7 +540,7 @@ You have access to analysis tools to help answer questions about this data. Use
 def get_visualization(filename):
     """Serve visualization images."""
     try:
-        filepath = os.path.join('visualizations', secure_filename(filename))
+        filepath = os.path.join(VIZ_FOLDER, secure_filename(filename))
         if os.path.exists(filepath):
             return send_file(filepath, mimetype='image/png')
         else:
@@ -374,8 +554,8 @@ def clear_session():
     """Clear current session data."""
     try:
         session_id = get_session_id()
-        if session_id in sessions_data:
-            del sessions_data[session_id]
+        with sessions_lock:
+            sessions_data.pop(session_id, None)
         session.clear()
         return jsonify({'success': True, 'message': 'Session cleared'})
     except Exception as e:
@@ -385,10 +565,13 @@ def clear_session():
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
+    with sessions_lock:
+        sessions_data.expire()
+        active_sessions = len(sessions_data)
     return jsonify({
         'status': 'healthy',
         'model': GEMINI_MODEL,
-        'active_sessions': len(sessions_data)
+        'active_sessions': active_sessions
     })
 
 
@@ -411,7 +594,6 @@ if __name__ == '__main__':
     print("CSV Chatbot Backend Server")
     print("=" * 60)
     print(f"Gemini Model: {GEMINI_MODEL}")
-    print(f"Upload folder: {UPLOAD_FOLDER}")
     print("Server starting on http://localhost:5001")
     print("=" * 60)   
     app.run(debug=True, host='0.0.0.0', port=5001)
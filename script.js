@@ -220,7 +220,13 @@ function addUserMessage(text) {
 function addAssistantMessage(html, visualizations = []) {
     const messageDiv = document.createElement('div');
     messageDiv.className = 'message assistant-message';
+    renderAssistantMessage(messageDiv, html, visualizations);
+    chatMessages.appendChild(messageDiv);
+    chatMessages.scrollTop = chatMessages.scrollHeight;
+    return messageDiv;
+}
 
+function renderAssistantMessage(messageDiv, html, visualizations = []) {
     let content = `<div class="message-content">${html}</div>`;
 
     // Add visualizations if any
@@ -231,8 +237,6 @@ function addAssistantMessage(html, visualizations = []) {
     }
 
     messageDiv.innerHTML = content;
-    chatMessages.appendChild(messageDiv);
-    chatMessages.scrollTop = chatMessages.scrollHeight;
 }
 
 function addLoadingMessage() {
@@ -268,25 +272,54 @@ async function sendChatMessage(message) {
         const response = await fetch(`${API_BASE_URL}/chat`, {
             method: 'POST',
             headers: {
-                'Content-Type': 'application/json'
+                'Content-Type': 'application/json',
+                'Accept': 'text/event-stream'
             },
             credentials: 'include',
             body: JSON.stringify({ message })
         });
 
-        const data = await response.json();
-
-        removeLoadingMessage();
-
         if (!response.ok) {
+            const data = await response.json();
+            removeLoadingMessage();
             throw new Error(data.error || 'Chat request failed');
         }
 
-        // Format the assistant's response
-        let formattedMessage = formatMarkdown(data.message);
+        // The reply streams in as server-sent events
+        let messageDiv = null;
+        let streamedText = '';
+        const visualizations = [];
+
+        await readEventStream(response, (event, data) => {
+            if (event === 'text') {
+                streamedText += data.text;
+            } else if (event === 'function_call') {
+                // Show charts as soon as each tool call finishes
+                if (data.function === 'create_visualization' && data.result && data.result.url) {
+                    visualizations.push(data.result.url);
+                }
+            } else if (event === 'done') {
+                streamedText = data.message;
+            } else if (event === 'error') {
+                throw new Error(data.error || 'Chat request failed');
+            } else {
+                return;
+            }
 
-        // Add assistant message with visualizations
-        addAssistantMessage(formattedMessage, data.visualizations);
+            if (!streamedText && !visualizations.length) return;
+
+            // Format the assistant's response so far
+            const formattedMessage = formatMarkdown(streamedText);
+            if (!messageDiv) {
+                removeLoadingMessage();
+                messageDiv = addAssistantMessage(formattedMessage, visualizations);
+            } else {
+                renderAssistantMessage(messageDiv, formattedMessage, visualizations);
+                chatMessages.scrollTop = chatMessages.scrollHeight;
+            }
+        });
+
+        removeLoadingMessage();
 
     } catch (error) {
         console.error('Chat error:', error);
@@ -297,6 +330,40 @@ async function sendChatMessage(message) {
     }
 }
 
+// Read a text/event-stream response, calling onEvent(event, data) for each event
+async function readEventStream(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        // Events are separated by a blank line
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const rawEvent = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let event = 'message';
+            let data = '';
+            rawEvent.split('\n').forEach(line => {
+                if (line.startsWith('event:')) {
+                    event = line.slice(6).trim();
+                } else if (line.startsWith('data:')) {
+                    data += line.slice(5).trim();
+                }
+            });
+
+            if (data) {
+                onEvent(event, JSON.parse(data));
+            }
+        }
+    }
+}
+
 // Format markdown-like text to HTML
 function formatMarkdown(text) {
     // Bold
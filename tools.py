@@ -5,25 +5,283 @@ These functions operate on pandas DataFrames and return JSON-serializable result
 
 import pandas as pd
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import seaborn as sns
 import json
 import ast
 import os
-from typing import Dict, Any, List
+import functools
+import types
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+from cachetools import LRUCache
+
+# Directory charts are written to; app.py serves and sweeps the same folder
+VIZ_FOLDER = 'visualizations'
+
+# matplotlib/seaborn are heavy to import, so they load on the first chart
+_MPL_READY = False
+_mpl_lock = threading.Lock()
+
+# Builtins that python_analysis code may never reference
+FORBIDDEN_NAMES = {'exec', 'eval', 'open', 'compile', 'input', '__import__',
+                   'getattr', 'setattr', 'delattr', 'globals', 'locals', 'vars'}
+
+# Attribute names that lead to the OS, the interpreter or the file system
+FORBIDDEN_ATTRIBUTES = {
+    'os', 'sys', 'subprocess', 'shutil', 'builtins', 'importlib', 'io', 'pickle',
+    'popen', 'system', 'environ', 'open',
+    # str.format resolves attribute paths written inside the format string
+    'format', 'format_map',
+    # pandas/NumPy file I/O (pandas readers are caught by their read_ prefix)
+    'to_csv', 'to_excel', 'to_json', 'to_parquet', 'to_pickle', 'to_hdf', 'to_sql',
+    'to_feather', 'to_stata', 'to_html', 'to_latex', 'to_markdown', 'to_xml', 'to_orc',
+    'to_clipboard', 'to_string', 'ExcelWriter', 'ExcelFile', 'HDFStore',
+    # matplotlib writers (canvas print_* methods are caught by their prefix)
+    'savefig', 'imsave',
+    'load', 'save', 'savez', 'savez_compressed', 'savetxt', 'loadtxt', 'genfromtxt',
+    'fromfile', 'tofile', 'fromregex', 'memmap', 'DataSource'
+}
+
+# Methods that evaluate expression strings; '@name' in them reaches the caller's variables
+EXPRESSION_METHODS = {'eval', 'query'}
+EXPRESSION_SCOPE_KEYWORDS = {'local_dict', 'global_dict', 'resolvers', 'level'}
+
+# The only modules python_analysis code may reach through pd/np attribute chains
+ALLOWED_MODULES = {
+    'pandas', 'pandas.api', 'pandas.api.types', 'pandas.offsets', 'pandas.tseries',
+    'pandas.tseries.offsets', 'numpy', 'numpy.random', 'numpy.linalg', 'numpy.fft', 'numpy.ma'
+}
+
+# Chart types and aggregations create_visualization accepts (they match the tool enums);
+# pandas runs the aggregations by name on its fast groupby path
+VIZ_TYPES = frozenset({'bar', 'line', 'scatter', 'histogram', 'box', 'pie', 'heatmap'})
+AGGREGATIONS = frozenset({'sum', 'mean', 'count', 'min', 'max', 'median'})
+
+# Operators python_analysis can hand to DataFrame.eval (numexpr) instead of exec.
+# //, % and ** are left to exec: numexpr returns integers where pandas gives
+# inf/NaN for a zero divisor or raises on negative integer powers.
+EVAL_BINARY_OPS = {
+    ast.Add: '+', ast.Sub: '-', ast.Mult: '*', ast.Div: '/', ast.BitAnd: '&', ast.BitOr: '|'
+}
+EVAL_UNARY_OPS = {ast.USub: '-', ast.Invert: '~'}
+EVAL_COMPARE_OPS = {
+    ast.Gt: '>', ast.GtE: '>=', ast.Lt: '<', ast.LtE: '<=', ast.Eq: '==', ast.NotEq: '!='
+}
+
+# Worker threads for statistical_summary; NumPy releases the GIL in its reductions
+_stats_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='stats')
+
+# Under copy-on-write a shallow copy isolates python_analysis edits; older pandas needs a deep one
+_COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3 or pd.get_option('mode.copy_on_write') is True
+
+# Tool results shared by every analyzer, keyed by CSV fingerprint and call arguments
+_shared_results = LRUCache(maxsize=1024)
+_shared_results_lock = threading.Lock()
+
+
+def shared_memoize(method):
+    """Cache a method's result across analyzers built from the same CSV contents."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.fingerprint is None:
+            return method(self, *args, **kwargs)
+        
+        key = (
+            self.fingerprint,
+            method.__name__,
+            json.dumps([args, kwargs], sort_keys=True, default=str)
+        )
+        with _shared_results_lock:
+            if key in _shared_results:
+                return _shared_results[key]
+        
+        result = method(self, *args, **kwargs)
+        with _shared_results_lock:
+            _shared_results[key] = result
+        return result
+    return wrapper
+
+
+def _setup_matplotlib():
+    """Import and configure matplotlib/seaborn once, the first time a chart is drawn."""
+    global _MPL_READY
+    with _mpl_lock:
+        if _MPL_READY:
+            return
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        # Set seaborn style, then the dark theme used for every chart
+        sns.set_theme(style="darkgrid")
+        plt.style.use('dark_background')
+        _MPL_READY = True
+
+
+def to_json_safe(value: Any) -> Any:
+    """Recursively convert a value into plain JSON types (string keys, native scalars)."""
+    if isinstance(value, dict):
+        return {str(k): to_json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_safe(v) for v in value]
+    if isinstance(value, np.generic):
+        return to_json_safe(value.item())
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _eval_source(node: ast.AST, columns: set) -> Optional[str]:
+    """Translate a column expression AST into DataFrame.eval syntax, or None if unsupported."""
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return repr(node.value)
+        return None
+    
+    # df['column'] becomes `column`
+    if isinstance(node, ast.Subscript):
+        if (isinstance(node.value, ast.Name) and node.value.id == 'df'
+                and isinstance(node.slice, ast.Constant) and isinstance(node.slice.value, str)
+                and '`' not in node.slice.value):
+            columns.add(node.slice.value)
+            return f"`{node.slice.value}`"
+        return None
+    
+    if isinstance(node, ast.BinOp) and type(node.op) in EVAL_BINARY_OPS:
+        left = _eval_source(node.left, columns)
+        right = _eval_source(node.right, columns)
+        if left is None or right is None:
+            return None
+        return f"({left} {EVAL_BINARY_OPS[type(node.op)]} {right})"
+    
+    if isinstance(node, ast.UnaryOp) and type(node.op) in EVAL_UNARY_OPS:
+        operand = _eval_source(node.operand, columns)
+        if operand is None:
+            return None
+        return f"({EVAL_UNARY_OPS[type(node.op)]}{operand})"
+    
+    # Chained comparisons mean something different in eval, so only single ones qualify
+    if (isinstance(node, ast.Compare) and len(node.ops) == 1
+            and type(node.ops[0]) in EVAL_COMPARE_OPS):
+        left = _eval_source(node.left, columns)
+        right = _eval_source(node.comparators[0], columns)
+        if left is None or right is None:
+            return None
+        return f"({left} {EVAL_COMPARE_OPS[type(node.ops[0])]} {right})"
+    
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _eval_expression(code: str) -> Optional[tuple]:
+    """
+    Recognize `result = <arithmetic/comparison on df columns>` code.
+    
+    Returns:
+        (eval expression, referenced columns) tuple, or None if exec is needed
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return None
+    
+    if len(tree.body) != 1 or not isinstance(tree.body[0], ast.Assign):
+        return None
+    assign = tree.body[0]
+    if (len(assign.targets) != 1 or not isinstance(assign.targets[0], ast.Name)
+            or assign.targets[0].id != 'result'):
+        return None
+    # A bare column or constant gains nothing from eval
+    if isinstance(assign.value, (ast.Constant, ast.Subscript)):
+        return None
+    
+    columns = set()
+    expression = _eval_source(assign.value, columns)
+    if expression is None or not columns:
+        return None
+    return expression, frozenset(columns)
+
+
+def _resolve_module_chain(node: ast.AST, namespace: Dict[str, Any]) -> Any:
+    """Resolve a pd/np attribute chain (e.g. pd.api.types) to its object, or None."""
+    if isinstance(node, ast.Name):
+        return namespace.get(node.id)
+    if isinstance(node, ast.Attribute):
+        parent = _resolve_module_chain(node.value, namespace)
+        if isinstance(parent, types.ModuleType):
+            return getattr(parent, node.attr, None)
+    return None
+
+
+def find_forbidden_operation(tree: ast.AST) -> Optional[str]:
+    """Walk python_analysis code once and return the first forbidden operation, if any."""
+    modules = {'pd': pd, 'np': np}
+    nodes = list(ast.walk(tree))
+    # pd/np may only appear as the root of an attribute chain, so they can't be aliased
+    attribute_roots = {id(node.value) for node in nodes if isinstance(node, ast.Attribute)}
+    called_functions = {id(node.func) for node in nodes if isinstance(node, ast.Call)}
+    
+    for node in nodes:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            return "import"
+        # Dunders can hide in strings that are later used as attribute paths
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and '__' in node.value:
+            return "__ in a string"
+        if isinstance(node, ast.Name):
+            if node.id.startswith('__') or node.id in FORBIDDEN_NAMES:
+                return node.id
+            if node.id in modules and id(node) not in attribute_roots:
+                return f"bare reference to {node.id}"
+        if isinstance(node, ast.Attribute):
+            if (node.attr.startswith(('__', 'read_', 'print_'))
+                    or node.attr in FORBIDDEN_ATTRIBUTES):
+                return node.attr
+            if node.attr in EXPRESSION_METHODS:
+                # pd.eval resolves bare names in the caller's scope, and an uncalled
+                # df.query/df.eval could be invoked later with an unchecked string
+                if id(node) not in called_functions or _resolve_module_chain(node.value, modules) is not None:
+                    return node.attr
+            target = _resolve_module_chain(node, modules)
+            if isinstance(target, types.ModuleType) and target.__name__ not in ALLOWED_MODULES:
+                return target.__name__
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr in EXPRESSION_METHODS):
+            # Only literal expressions without '@' local references
+            for arg in node.args:
+                if not (isinstance(arg, ast.Constant) and isinstance(arg.value, str)) or '@' in arg.value:
+                    return f"{node.func.attr} with a non-literal or '@' expression"
+            for keyword in node.keywords:
+                if keyword.arg is None or keyword.arg in EXPRESSION_SCOPE_KEYWORDS:
+                    return f"{node.func.attr} with {keyword.arg or '**kwargs'}"
+    return None
 
-# Set seaborn style
-sns.set_theme(style="darkgrid")
 
 class DataFrameAnalyzer:
     """Analyzer class that holds DataFrame state and provides analysis tools."""
     
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, fingerprint: Optional[str] = None):
         self.df = df
+        # Hash of the source CSV bytes; enables cross-session result caching
+        self.fingerprint = fingerprint
         self.viz_counter = 0
+        # Chart files this analyzer wrote; kept while its session is alive
+        self.viz_files = set()
+        self._info_cache = None
+        self._numeric_df = df.select_dtypes(include=[np.number])
+        self._summary_cache = {}
+        self._corr_cache = None
+        # One figure per analyzer, created on the first chart and redrawn after that
+        self._fig = None
+        # Tool name (as declared in TOOLS) to the method that implements it
+        self.tool_functions = {
+            'dataframe_info': self.dataframe_info,
+            'statistical_summary': self.statistical_summary,
+            'python_analysis': self.python_analysis,
+            'create_visualization': self.create_visualization
+        }
         
+    @shared_memoize
     def dataframe_info(self) -> Dict[str, Any]:
         """
         Get metadata about the DataFrame including columns, shape, data types, and missing values.
@@ -31,6 +289,11 @@ class DataFrameAnalyzer:
         Returns:
             Dictionary with DataFrame metadata
         """
+        # The session DataFrame never changes after upload, so compute once
+        if self._info_cache is not None:
+            return self._info_cache
+        
+        missing = self.df.isna().sum()
         info = {
             "shape": {
                 "rows": int(self.df.shape[0]),
@@ -38,15 +301,14 @@ class DataFrameAnalyzer:
             },
             "columns": list(self.df.columns),
             "dtypes": {col: str(dtype) for col, dtype in self.df.dtypes.items()},
-            "missing_values": {
-                col: int(self.df[col].isna().sum()) 
-                for col in self.df.columns
-            },
-            "total_missing": int(self.df.isna().sum().sum()),
+            "missing_values": {col: int(count) for col, count in missing.items()},
+            "total_missing": int(missing.sum()),
             "memory_usage_mb": float(self.df.memory_usage(deep=True).sum() / (1024 * 1024))
         }
+        self._info_cache = info
         return info
     
+    @shared_memoize
     def statistical_summary(self, columns: List[str] = None) -> Dict[str, Any]:
         """
         Generate descriptive statistics for numeric columns.
@@ -57,26 +319,45 @@ class DataFrameAnalyzer:
         Returns:
             Dictionary with statistical summaries
         """
+        cache_key = tuple(sorted(columns)) if columns else None
+        if cache_key in self._summary_cache:
+            return self._summary_cache[cache_key]
+        
         if columns:
-            df_subset = self.df[columns]
+            df_subset = self.df[list(columns)]
         else:
-            df_subset = self.df.select_dtypes(include=[np.number])
+            df_subset = self._numeric_df
         
         if df_subset.empty:
             return {"error": "No numeric columns found"}
         
-        summary = df_subset.describe().to_dict()
+        # Each statistic is a separate pass over the data, so run them concurrently
+        futures = {
+            "describe": _stats_executor.submit(df_subset.describe),
+            "skewness": _stats_executor.submit(df_subset.skew),
+            "kurtosis": _stats_executor.submit(df_subset.kurtosis)
+        }
+        if len(df_subset.columns) > 1:
+            futures["correlations"] = _stats_executor.submit(df_subset.corr)
         
         # Add additional statistics
         result = {
-            "describe": summary,
-            "correlations": df_subset.corr().to_dict() if len(df_subset.columns) > 1 else {},
-            "skewness": df_subset.skew().to_dict(),
-            "kurtosis": df_subset.kurtosis().to_dict()
+            "describe": futures["describe"].result().to_dict(),
+            "correlations": futures["correlations"].result().to_dict() if "correlations" in futures else {},
+            "skewness": futures["skewness"].result().to_dict(),
+            "kurtosis": futures["kurtosis"].result().to_dict()
         }
         
+        self._summary_cache[cache_key] = result
         return result
     
+    @shared_memoize
+    def _correlation_matrix(self) -> pd.DataFrame:
+        """Correlation matrix of all numeric columns, computed once per DataFrame."""
+        if self._corr_cache is None:
+            self._corr_cache = self._numeric_df.corr()
+        return self._corr_cache
+    
     def python_analysis(self, code: str) -> Dict[str, Any]:
         """
         Execute pandas code safely on the DataFrame.
@@ -94,34 +375,38 @@ class DataFrameAnalyzer:
             return {"error": f"Syntax error in code: {str(e)}"}
         
         # Check for dangerous operations
-        dangerous_keywords = ['import', 'exec', 'eval', '__', 'open', 'file', 'input', 'compile']
-        code_lower = code.lower()
-        for keyword in dangerous_keywords:
-            if keyword in code_lower:
-                return {"error": f"Forbidden operation detected: {keyword}"}
+        forbidden = find_forbidden_operation(parsed)
+        if forbidden:
+            return {"error": f"Forbidden operation detected: {forbidden}"}
         
         # Execute code in restricted namespace
         try:
-            local_vars = {'df': self.df, 'pd': pd, 'np': np}
-            exec(code, {"__builtins__": {}}, local_vars)
-            
-            # Get the result (last variable or modified df)
-            if 'result' in local_vars:
-                result = local_vars['result']
-            else:
-                result = local_vars['df']
+            result = self._try_eval(code)
+            if result is None:
+                # User code gets its own frame so edits never reach self.df or the caches
+                local_vars = {'df': self.df.copy(deep=not _COPY_ON_WRITE), 'pd': pd, 'np': np}
+                exec(code, {"__builtins__": {}}, local_vars)
+                
+                # Get the result (last variable or modified df)
+                if 'result' in local_vars:
+                    result = local_vars['result']
+                else:
+                    result = local_vars['df']
             
             # Convert result to JSON-serializable format
+            if isinstance(result, np.generic):
+                result = result.item()
+            
             if isinstance(result, pd.DataFrame):
                 return {
                     "type": "dataframe",
-                    "data": result.head(10).to_dict('records'),
+                    "data": to_json_safe(result.head(10).to_dict('records')),
                     "shape": list(result.shape)
                 }
             elif isinstance(result, pd.Series):
                 return {
                     "type": "series",
-                    "data": result.head(10).to_dict()
+                    "data": to_json_safe(result.head(10).to_dict())
                 }
             elif isinstance(result, (int, float, str, bool)):
                 return {
@@ -131,7 +416,7 @@ class DataFrameAnalyzer:
             elif isinstance(result, (list, dict)):
                 return {
                     "type": "collection",
-                    "value": result
+                    "value": to_json_safe(result)
                 }
             else:
                 return {
@@ -142,6 +427,25 @@ class DataFrameAnalyzer:
         except Exception as e:
             return {"error": f"Execution error: {str(e)}"}
     
+    def _try_eval(self, code: str) -> Optional[pd.Series]:
+        """
+        Evaluate simple column arithmetic with DataFrame.eval, which runs it through
+        numexpr's compiled, multithreaded kernels. Returns None when exec is needed.
+        """
+        parsed = _eval_expression(code)
+        if parsed is None:
+            return None
+        
+        expression, columns = parsed
+        # numexpr only handles numeric columns
+        if not columns.issubset(self._numeric_df.columns):
+            return None
+        
+        try:
+            return self.df.eval(expression)
+        except Exception:
+            return None
+    
     def create_visualization(
         self,
         viz_type: str,
@@ -165,24 +469,37 @@ class DataFrameAnalyzer:
         Returns:
             Dictionary with visualization file path
         """
+        # Reject bad arguments before a chart number or the shared figure is used
+        if viz_type not in VIZ_TYPES:
+            return {"error": f"Unsupported visualization type: {viz_type}"}
+        if viz_type == "bar" and y_column and aggregation not in AGGREGATIONS:
+            return {"error": f"Unsupported aggregation: {aggregation}"}
+        
         try:
             # Create visualizations directory if it doesn't exist
-            viz_dir = "visualizations"
-            os.makedirs(viz_dir, exist_ok=True)
+            os.makedirs(VIZ_FOLDER, exist_ok=True)
             
             # Generate filename
             self.viz_counter += 1
             filename = f"viz_{self.viz_counter}.png"
-            filepath = os.path.join(viz_dir, filename)
+            filepath = os.path.join(VIZ_FOLDER, filename)
             
-            # Create figure with dark theme
-            plt.style.use('dark_background')
-            fig, ax = plt.subplots(figsize=(10, 6))
+            _setup_matplotlib()
+            import seaborn as sns
+            from matplotlib.figure import Figure
+            
+            # Reset the reusable figure
+            if self._fig is None:
+                self._fig = Figure(figsize=(10, 6))
+            fig = self._fig
+            fig.clear()
+            ax = fig.add_subplot()
             
             # Create visualization based on type
             if viz_type == "bar":
                 if y_column:
-                    data = self.df.groupby(x_column)[y_column].agg(aggregation)
+                    # observed=True skips unused categories should x_column be categorical
+                    data = self.df.groupby(x_column, observed=True)[y_column].agg(aggregation)
                     data.plot(kind='bar', ax=ax, color='#5B9FFF')
                 else:
                     self.df[x_column].value_counts().plot(kind='bar', ax=ax, color='#5B9FFF')
@@ -213,7 +530,7 @@ class DataFrameAnalyzer:
                     
             elif viz_type == "pie":
                 if y_column:
-                    data = self.df.groupby(x_column)[y_column].sum()
+                    data = self.df.groupby(x_column, observed=True)[y_column].sum()
                 else:
                     data = self.df[x_column].value_counts()
                 data.plot(kind='pie', ax=ax, autopct='%1.1f%%')
@@ -221,11 +538,7 @@ class DataFrameAnalyzer:
                 
             elif viz_type == "heatmap":
                 # Correlation heatmap for numeric columns
-                numeric_df = self.df.select_dtypes(include=[np.number])
-                sns.heatmap(numeric_df.corr(), annot=True, fmt='.2f', ax=ax, cmap='coolwarm')
-                
-            else:
-                return {"error": f"Unsupported visualization type: {viz_type}"}
+                sns.heatmap(self._correlation_matrix(), annot=True, fmt='.2f', ax=ax, cmap='coolwarm')
             
             # Set title
             if title:
@@ -234,11 +547,11 @@ class DataFrameAnalyzer:
                 ax.set_title(f"{viz_type.capitalize()} Chart", fontsize=14, fontweight='bold')
             
             # Improve layout
-            plt.tight_layout()
+            fig.tight_layout()
             
             # Save figure
-            plt.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='#121212')
-            plt.close()
+            fig.savefig(filepath, dpi=100, facecolor='#121212')
+            self.viz_files.add(filename)
             
             return {
                 "success": True,